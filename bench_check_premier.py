@@ -0,0 +1,155 @@
+#benchmarking check_premier_fast (streamed <head> only) against check_premier (full page)
+#usage: python bench_check_premier.py [first_game_id] [number_of_ids]
+#       python bench_check_premier.py offline   (stubbed pages, no network needed)
+import sys
+import time
+import requests
+
+from web_scrape import MAX_HEAD_BYTES, check_premier, check_premier_fast, read_head
+
+
+def measure(check_function, url):
+    #new session per call so both functions pay for their own connection
+    session = requests.Session()
+    responses = []
+    session.hooks['response'].append(lambda response, *args, **kwargs: responses.append(response))
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    result = check_function(url, session)
+    latency = time.perf_counter() - start
+    cpu_time = time.process_time() - cpu_start
+
+    # raw.tell() is the number of bytes read off the wire (before decompression)
+    bytes_read = sum(response.raw.tell() for response in responses)
+    session.close()
+    return result, bytes_read, cpu_time, latency
+
+
+
+##-------------Offline checks-----------------##
+class StubResponse:
+    #stands in for a streamed requests response, serving the page in fixed chunks
+    def __init__(self, chunks, status_code=200):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.text = b''.join(chunks).decode('utf-8')
+        self.bytes_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+class StubSession:
+    def __init__(self, chunks, status_code=200):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.responses = []
+
+    def get(self, url, stream=False):
+        response = StubResponse(self.chunks, self.status_code)
+        self.responses.append(response)
+        return response
+
+
+def split_page(page, chunk_size):
+    return [page[i:i + chunk_size] for i in range(0, len(page), chunk_size)]
+
+
+def run_offline_checks():
+    url = "https://www.leagueofireland.ie/game_centre/0/"
+    premier_meta = b'<meta name="description" content="Game Centre, SSE Airtricity Men\'s Premier Division">'
+    body = b'<body>' + b'<p>match report</p>' * 500 + b'</body></html>'
+
+    # </head> split across two chunks at every possible offset
+    page = b'<html><head><title>Game</title>' + premier_meta + b'</head>' + body
+    head_end = page.index(b'</head>')
+    for split in range(head_end, head_end + len(b'</head>')):
+        chunks = [page[:split], page[split:head_end + 200], page[head_end + 200:]]
+        page_head, head_complete = read_head(iter(chunks))
+        assert head_complete and page_head == page[:head_end + len(b'</head>')], split
+
+    # Mixed case </HEAD>, stops reading after the head
+    page = b'<HTML><HEAD>' + premier_meta + b'</HEAD>' + body
+    session = StubSession(split_page(page, 64))
+    assert check_premier_fast(url, session) is True
+    assert len(session.responses) == 1 and session.responses[0].bytes_read < len(page)
+
+    # Head complete but no description tag - False without a second fetch
+    page = b'<html><head><title>Game</title></head>' + body
+    session = StubSession(split_page(page, 64))
+    assert check_premier_fast(url, session) is False
+    assert len(session.responses) == 1 and session.responses[0].bytes_read < len(page)
+
+    # No </head> at all - whole page parsed from the one response
+    page = b'<html>' + premier_meta + body
+    session = StubSession(split_page(page, 64))
+    assert check_premier_fast(url, session) is True
+    assert len(session.responses) == 1 and session.responses[0].bytes_read == len(page)
+
+    # No </head> within MAX_HEAD_BYTES - the rest of the same response is read, not refetched
+    page = b'<html>' + b'<!-- padding -->' * (MAX_HEAD_BYTES // 16 + 1) + premier_meta + body
+    session = StubSession(split_page(page, 4096))
+    page_head, head_complete = read_head(iter(session.chunks))
+    assert not head_complete and len(page_head) > MAX_HEAD_BYTES
+    assert check_premier_fast(url, session) is True
+    assert len(session.responses) == 1 and session.responses[0].bytes_read == len(page)
+
+    # Non-200 - False from the one request, nothing read
+    session = StubSession([b'<html><head></head></html>'], status_code=404)
+    assert check_premier_fast(url, session) is False
+    assert len(session.responses) == 1 and session.responses[0].bytes_read == 0
+
+    # Same answer as check_premier on complete pages
+    for page in (b'<html><head>' + premier_meta + b'</head>' + body,
+                 b'<html><head><meta name="description" content="Game Centre, First Division"></head>' + body,
+                 b'<html><head></head>' + body):
+        assert check_premier_fast(url, StubSession(split_page(page, 100))) == check_premier(url, StubSession([page]))
+
+    print("offline checks passed")
+
+
+##-------------Network benchmark-----------------##
+def run_benchmark(first_id, number_of_ids):
+    totals = {'full': [0, 0.0, 0.0], 'fast': [0, 0.0, 0.0]}
+    mismatches = []
+
+    print(f"{'id':>6} {'premier':>8} {'full kB':>8} {'fast kB':>8} {'full cpu ms':>12} {'fast cpu ms':>12} {'full ms':>8} {'fast ms':>8}")
+    for game_id in range(first_id, first_id + number_of_ids):
+        url = f"https://www.leagueofireland.ie/game_centre/{game_id}/"
+        full = measure(check_premier, url)
+        fast = measure(check_premier_fast, url)
+
+        if full[0] != fast[0]:
+            mismatches.append(game_id)
+        for name, res in (('full', full), ('fast', fast)):
+            totals[name][0] += res[1]
+            totals[name][1] += res[2]
+            totals[name][2] += res[3]
+
+        print(f"{game_id:>6} {str(fast[0]):>8} {full[1] / 1024:>8.1f} {fast[1] / 1024:>8.1f} "
+              f"{full[2] * 1000:>12.1f} {fast[2] * 1000:>12.1f} {full[3] * 1000:>8.0f} {fast[3] * 1000:>8.0f}")
+
+    ##-------------Summary-----------------##
+    print()
+    for name in ('full', 'fast'):
+        total_bytes, total_cpu, total_latency = totals[name]
+        print(f"{name}: {total_bytes / 1024 / number_of_ids:.1f} kB, "
+              f"{total_cpu * 1000 / number_of_ids:.1f} ms cpu, "
+              f"{total_latency * 1000 / number_of_ids:.0f} ms latency per id")
+    print(f"mismatched results: {mismatches if mismatches else 'none'}")
+
+
+if len(sys.argv) > 1 and sys.argv[1] == 'offline':
+    run_offline_checks()
+else:
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 4467,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 20)
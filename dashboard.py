@@ -6,9 +6,15 @@ from dash import Dash, dcc, html, Input, Output, callback
 import dash_bootstrap_components as dbc
 from datetime import datetime
 import base64
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from flask import Response, abort, request
 
 #loading the extracted data into the script
-loi_df = pd.read_csv('data/loi_df.csv', index_col=0)
+data_file = 'data/loi_df.csv'
+loi_df = pd.read_csv(data_file, index_col=0)
 #converting date column for proper sorting
 loi_df['date'] = pd.to_datetime(loi_df['date'])
 # Extract month from date
@@ -452,6 +458,108 @@ def update_season_stats(selected_club, selected_season):
     return stats_content
 
 
+##-----------------JSON data API-----------------##
+# Read-only endpoints on the Flask server so other tools don't need to scrape
+# the dashboard or re-read the csv. Everything is served from the aggregated
+# dataframes above, and the data only changes when the csv is re-scraped and
+# the app redeployed, so each response body is built once and cached.
+
+# Data version - hash of the csv, used as the etag for every api response
+with open(data_file, 'rb') as f:
+    data_version = hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def records_to_list(df):
+    # to_json handles timestamps, numpy types and NaN (-> null) for us
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+
+def filter_club_season(df, club, season):
+    if club is not None:
+        df = df[df['home_team'] == club]
+    if season is not None:
+        df = df[df['season'] == season]
+    return df
+
+
+@lru_cache(maxsize=256)
+def api_payload(endpoint, club, season):
+    # Returns the plain and gzipped json body for an endpoint/filter combination
+    if endpoint == 'aggregates':
+        if club is None:
+            data = filter_club_season(season_stats, None, season).sort_values('season')
+        else:
+            data = filter_club_season(team_stats, club, season).sort_values('season')
+    elif endpoint == 'monthly':
+        if club is None:
+            data = filter_club_season(season_month_stats, None, season)
+        else:
+            data = filter_club_season(team_month_stats, club, season)
+    else:
+        matches = filter_club_season(loi_df, club, season).sort_values('date')
+        data = matches[['date', 'season', 'home_team', 'away_team', 'score',
+                        'kick_off_time', 'stadium', 'referee', 'attendance']]
+
+    body = json.dumps({
+        'version': data_version,
+        'club': club,
+        'season': season,
+        'data': records_to_list(data)
+    }, separators=(',', ':')).encode('utf-8')
+    # mtime=0 keeps the gzipped bytes identical for identical data
+    return body, gzip.compress(body, mtime=0)
+
+
+def api_response(endpoint):
+    # Optional filters: ?club=<home team>&season=<year>
+    club = request.args.get('club') or None
+    season = request.args.get('season') or None
+    if season is not None:
+        try:
+            season = int(season)
+        except ValueError:
+            abort(400, description=f'Invalid season: {season}')
+
+    use_gzip = request.accept_encodings['gzip'] > 0
+    # Strong etag per representation, so the gzipped body gets its own tag
+    etag = f'{data_version}-gzip' if use_gzip else data_version
+
+    headers = {
+        'ETag': f'"{etag}"',
+        'Vary': 'Accept-Encoding',
+        'Cache-Control': 'public, no-cache'
+    }
+
+    # Conditional GET - nothing to send if the client already has this version
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+
+    body, gzip_body = api_payload(endpoint, club, season)
+    if use_gzip:
+        body = gzip_body
+        headers['Content-Encoding'] = 'gzip'
+
+    return Response(body, status=200, headers=headers, mimetype='application/json')
+
+
+#Per club/season attendance averages and totals (league-wide if no club given)
+@server.route('/api/v1/aggregates')
+def api_aggregates():
+    return api_response('aggregates')
+
+
+#Monthly average attendance series (league-wide if no club given)
+@server.route('/api/v1/monthly')
+def api_monthly():
+    return api_response('monthly')
+
+
+#Match list with attendances, filtered on home team and/or season
+@server.route('/api/v1/matches')
+def api_matches():
+    return api_response('matches')
+
+
 #running the server
 if __name__ == '__main__':
     app.run_server(debug=False, host='0.0.0.0')
\ No newline at end of file
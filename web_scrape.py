@@ -1,11 +1,12 @@
 import requests
-from bs4 import BeautifulSoup 
+from bs4 import BeautifulSoup, SoupStrainer
 import random
 import pandas as pd
 from datetime import datetime
 import time
 import base64
 import os
+import importlib.util
 
 #importing visualisation libraries
 import seaborn as sns
@@ -24,9 +25,27 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+#lxml is much faster than html.parser for the head-only check, use it if installed
+#(pip install lxml) - without it check_premier_fast still streams but parses with html.parser
+head_parser = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+#reading the game centre page in chunks until the end of <head>
+HEAD_CHUNK_SIZE = 4096
+#parsing the whole page (from the same response) if no </head> by this point
+MAX_HEAD_BYTES = 256 * 1024
+
 ## Defining functions
-def check_premier(url):
-    response = requests.get(url)
+def is_premier_description(meta_content):
+    # Find the part that starts with "Premier"
+    cont = False
+    for word in meta_content.split(","):
+        if "Premier" in word:
+            cont = True
+    return cont
+
+
+def check_premier(url, session=requests):
+    response = session.get(url)
 
     if response.status_code == 200:
         page_content = response.text
@@ -40,12 +59,45 @@ def check_premier(url):
     # Extract the content
     meta_content = meta_tag["content"] if meta_tag else ""
 
-    # Find the part that starts with "Premier"
-    cont = False
-    for word in meta_content.split(","):
-        if "Premier" in word:
-            cont = True
-    return cont
+    return is_premier_description(meta_content)
+
+
+def read_head(chunks):
+    #reading chunks until </head> has been seen
+    #returns the bytes read and whether the head was complete, leaving the rest of chunks unread
+    page_head = bytearray()
+    for chunk in chunks:
+        # Only search the new chunk (plus enough overlap for a split tag)
+        search_from = max(len(page_head) - len(b'</head>'), 0)
+        page_head += chunk
+        end = page_head[search_from:].lower().find(b'</head>')
+        if end != -1:
+            return bytes(page_head[:search_from + end + len(b'</head>')]), True
+        if len(page_head) > MAX_HEAD_BYTES:
+            break
+    return bytes(page_head), False
+
+
+def check_premier_fast(url, session=requests):
+    #same result as check_premier but only downloads and parses the <head>
+    with session.get(url, stream=True) as response:
+        if response.status_code != 200:
+            print(f"Failed to retrieve the page. Status code: {response.status_code}")
+            return False
+
+        chunks = response.iter_content(chunk_size=HEAD_CHUNK_SIZE)
+        page_content, head_complete = read_head(chunks)
+        if not head_complete:
+            #no </head> found - reading the rest of the same response and parsing it all
+            page_content += b''.join(chunks)
+
+    description = SoupStrainer("meta", attrs={"name": "description"})
+    soup = BeautifulSoup(page_content, head_parser, parse_only=description)
+    meta_tag = soup.find("meta", attrs={"name": "description"})
+    # Extract the content
+    meta_content = meta_tag.get("content", "") if meta_tag else ""
+
+    return is_premier_description(meta_content)
 
 
 def scrape_loi_webpage(url):
@@ -171,64 +223,65 @@ def format_dataframe(data):
 
 
 
-##---------------------------------##
-#loading in historical data
-loi_df = pd.read_csv('data/loi_df.csv', index_col=0)
-loi_df['date'] = pd.to_datetime(loi_df['date'])
+if __name__ == '__main__':
+    ##---------------------------------##
+    #loading in historical data
+    loi_df = pd.read_csv('data/loi_df.csv', index_col=0)
+    loi_df['date'] = pd.to_datetime(loi_df['date'])
 
-#loading in the broaken url df
-broken_url = pd.read_csv('data/broken_url.csv', index_col=0)
+    #loading in the broaken url df
+    broken_url = pd.read_csv('data/broken_url.csv', index_col=0)
 
-#getting last link that scrape was run for
-last_link = loi_df['last_link'].unique()[0]
+    #getting last link that scrape was run for
+    last_link = loi_df['last_link'].unique()[0]
 
 
-#---------------Looping through links-----------------#
-#creating code for looping through links
-for i in range (last_link + 1, last_link + 30):
-    url = f"https://www.leagueofireland.ie/game_centre/{i}/"
-    #run function to determine whether or not premier division game
-    is_prem = check_premier(url)
+    #---------------Looping through links-----------------#
+    #creating code for looping through links
+    for i in range (last_link + 1, last_link + 30):
+        url = f"https://www.leagueofireland.ie/game_centre/{i}/"
+        #run function to determine whether or not premier division game
+        is_prem = check_premier_fast(url)
     
-    #if it is premier division game, continue with processing
-    if is_prem: 
-        res = scrape_loi_webpage(url)
-        #breaking loop if date is not before today
-        if res[-1]:
-            print("Match date is in the future. Breaking loop.")
-            break #exiting the loop
+        #if it is premier division game, continue with processing
+        if is_prem: 
+            res = scrape_loi_webpage(url)
+            #breaking loop if date is not before today
+            if res[-1]:
+                print("Match date is in the future. Breaking loop.")
+                break #exiting the loop
             
-        #not merging if attendance missing
-        if (len(res[6]) != 4) and (res[4] != 'postponed'):
-            broken_url = pd.concat([broken_url, pd.DataFrame({'url': [url]})], ignore_index=True)
-        elif (res[4] != 'postponed'): 
-            df = format_dataframe(res[0:7])
-            loi_df =  pd.concat([loi_df, df], ignore_index=True)
-            loi_df['last_link'] = int(i)
-
-#sorting by date
-loi_df = loi_df.sort_values(by='date').reset_index(drop=True)
-
-##-------------Saving new data-----------------##
-# Directory where the file is located
-data_dir = "data"
-
-# Original file path
-original_file = os.path.join(data_dir, "loi_df.csv")
-
-# Check if the original file exists
-if os.path.exists(original_file):
-    # Get the current timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            #not merging if attendance missing
+            if (len(res[6]) != 4) and (res[4] != 'postponed'):
+                broken_url = pd.concat([broken_url, pd.DataFrame({'url': [url]})], ignore_index=True)
+            elif (res[4] != 'postponed'): 
+                df = format_dataframe(res[0:7])
+                loi_df =  pd.concat([loi_df, df], ignore_index=True)
+                loi_df['last_link'] = int(i)
+
+    #sorting by date
+    loi_df = loi_df.sort_values(by='date').reset_index(drop=True)
+
+    ##-------------Saving new data-----------------##
+    # Directory where the file is located
+    data_dir = "data"
+
+    # Original file path
+    original_file = os.path.join(data_dir, "loi_df.csv")
+
+    # Check if the original file exists
+    if os.path.exists(original_file):
+        # Get the current timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Create the new filename with timestamp
-    backup_file = os.path.join(data_dir, f"loi_df_{timestamp}.csv")
+        # Create the new filename with timestamp
+        backup_file = os.path.join(data_dir, f"loi_df_{timestamp}.csv")
     
-    # Rename the existing file
-    os.rename(original_file, backup_file)
-    print(f"Backed up existing file to {backup_file}")
-
-# Save the new dataframe
-loi_df.to_csv(original_file)
-broken_url.to_csv('data/broken_url.csv')
-print(f"Saved new data to {original_file}")
+        # Rename the existing file
+        os.rename(original_file, backup_file)
+        print(f"Backed up existing file to {backup_file}")
+
+    # Save the new dataframe
+    loi_df.to_csv(original_file)
+    broken_url.to_csv('data/broken_url.csv')
+    print(f"Saved new data to {original_file}")